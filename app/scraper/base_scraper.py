@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 import logging
 import logging.config
+import re
 import time
 import os
 import random
@@ -21,22 +22,84 @@ from selenium.webdriver.support import expected_conditions as EC
 from fake_useragent import UserAgent
 from bs4 import BeautifulSoup
 
-from app.config import SCRAPING_CONFIG, LOGGING_CONFIG, RATE_LIMITS
+from app.config import (
+    SCRAPING_CONFIG,
+    LOGGING_CONFIG,
+    RATE_LIMITS,
+    TIMEOUT,
+    RETRY_ATTEMPTS,
+    DELAY_BETWEEN_REQUESTS,
+    DEFAULT_HTML_PARSER,
+)
 from .utils import clean_text, extract_emails, validate_url
 
 # Setup logging
 logging.config.dictConfig(LOGGING_CONFIG)
 
+# Validation helpers compiled/built once instead of per call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_INVALID_DOMAINS = frozenset({'example.com', 'test.com', 'localhost'})
+
+# Deletion table for stripping non-digits — str.translate runs in C and
+# beats a regex sub on short phone strings
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(256) if not chr(c).isdigit()
+))
+
+# Static Chrome flags shared by every driver instance; declared once so
+# get_driver only appends the per-instance user-agent and proxy args
+_DEFAULT_CHROME_ARGUMENTS = (
+    '--headless=new',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-infobars',
+    '--disable-notifications',
+    '--disable-popup-blocking',
+    '--window-size=1920,1080',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-javascript',
+    # Additional stealth settings
+    '--disable-webgl',
+    '--disable-canvas-aa',
+    '--disable-2d-canvas-clip-aa',
+    '--disable-accelerated-2d-canvas',
+    # Image decoding adds nothing to HTML extraction
+    '--blink-settings=imagesEnabled=false',
+)
+
+
+def _build_default_chrome_options() -> Options:
+    """Build a fresh Options object preloaded with the shared flags"""
+    options = Options()
+    for argument in _DEFAULT_CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    # Return from driver.get on DOMContentLoaded instead of the full
+    # load event — subresource tails routinely add seconds per page
+    options.page_load_strategy = 'eager'
+    options.add_experimental_option('excludeSwitches', ['enable-automation'])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_experimental_option(
+        'prefs', {'profile.managed_default_content_settings.images': 2}
+    )
+    return options
+
 class BaseScraper(ABC):
     """Base class for web scraping with advanced features"""
     
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.user_agent = UserAgent()
+        # Sample the UA database once — fake_useragent may hit disk or
+        # network internally, so rotate through a fixed pool instead of
+        # asking it for a fresh string per request
+        self._ua_pool = tuple(self.user_agent.random for _ in range(20))
         self.session = self._create_session()
         self.last_request_time = 0
         self._driver = None
         self._wait = None
+        self._stealth_applied_url = None
         self._setup_logging()
 
     def _setup_logging(self):
@@ -50,7 +113,7 @@ class BaseScraper(ABC):
         """Create and configure HTTP session with rotating headers"""
         session = requests.Session()
         session.headers.update({
-            'User-Agent': self.user_agent.random,
+            'User-Agent': random.choice(self._ua_pool),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Connection': 'keep-alive',
@@ -65,28 +128,9 @@ class BaseScraper(ABC):
         if self._driver is not None:
             return self._driver
 
-        options = Options()
-        options.add_argument('--headless=new')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument(f'user-agent={self.user_agent.random}')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-infobars')
-        options.add_argument('--disable-notifications')
-        options.add_argument('--disable-popup-blocking')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--disable-javascript')
-        options.add_experimental_option('excludeSwitches', ['enable-automation'])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        # Additional stealth settings
-        options.add_argument('--disable-webgl')
-        options.add_argument('--disable-canvas-aa')
-        options.add_argument('--disable-2d-canvas-clip-aa')
-        options.add_argument('--disable-accelerated-2d-canvas')
-        
+        options = _build_default_chrome_options()
+        options.add_argument(f'user-agent={random.choice(self._ua_pool)}')
+
         self.logger.debug("Chrome options configured.")
 
         # Proxy configuration
@@ -113,8 +157,8 @@ class BaseScraper(ABC):
         try:
             service = Service(executable_path=str(driver_file))
             self._driver = webdriver.Chrome(service=service, options=options)
-            self._driver.set_page_load_timeout(SCRAPING_CONFIG.get('timeout', 30))
-            self._wait = WebDriverWait(self._driver, SCRAPING_CONFIG.get('timeout', 30))
+            self._driver.set_page_load_timeout(TIMEOUT)
+            self._wait = WebDriverWait(self._driver, TIMEOUT)
             
             # Execute stealth JavaScript
             self._execute_stealth_js()
@@ -135,14 +179,37 @@ class BaseScraper(ABC):
         """
         try:
             self._driver.execute_script(stealth_js)
+            self._stealth_applied_url = self._driver.current_url
         except Exception as e:
             self.logger.warning(f"Failed to execute stealth JS: {e}")
 
+    def _ensure_stealth(self):
+        """Re-apply the stealth script only after a navigation
+
+        The script mutates properties of the current document, which
+        survive cookie clearing — re-executing on the same page is a
+        wasted JS roundtrip.
+        """
+        if self._driver is None:
+            return
+        try:
+            current_url = self._driver.current_url
+        except WebDriverException:
+            current_url = None
+        if current_url != self._stealth_applied_url:
+            self._execute_stealth_js()
+
     def wait_for_element(self, by: By, value: str, timeout: Optional[int] = None) -> Any:
         """Wait for element with improved error handling"""
-        timeout = timeout or SCRAPING_CONFIG.get('timeout', 30)
+        timeout = timeout or TIMEOUT
         try:
-            return WebDriverWait(self._driver, timeout).until(
+            # Reuse the wait built in get_driver; only allocate a fresh
+            # one for a non-default timeout
+            if self._wait is not None and timeout == TIMEOUT:
+                wait = self._wait
+            else:
+                wait = WebDriverWait(self._driver, timeout)
+            return wait.until(
                 EC.presence_of_element_located((by, value))
             )
         except TimeoutException:
@@ -185,9 +252,19 @@ class BaseScraper(ABC):
         except (NoSuchElementException, AttributeError):
             return None
 
+    def fetch_html(self, url: str) -> Optional[str]:
+        """Fetch static HTML over the plain HTTP session (no browser)"""
+        try:
+            response = self.session.get(url, timeout=TIMEOUT)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            self.logger.error(f"HTTP fetch failed for {url}: {e}")
+            return None
+
     def get_page_source_parsed(self) -> BeautifulSoup:
         """Get parsed page source with BeautifulSoup"""
-        return BeautifulSoup(self._driver.page_source, 'html.parser')
+        return BeautifulSoup(self._driver.page_source, DEFAULT_HTML_PARSER)
 
     def validate_data(self, data: Dict[str, Any]) -> bool:
         """Validate scraped data comprehensively"""
@@ -195,11 +272,13 @@ class BaseScraper(ABC):
             return False
             
         required_fields = SCRAPING_CONFIG.get('required_fields', ['name', 'website'])
-        
-        # Check required fields
-        if not all(data.get(field) for field in required_fields):
-            return False
-            
+
+        # Check required fields, bailing out on the first miss
+        for field in required_fields:
+            if not data.get(field):
+                return False
+
+
         # Validate specific fields
         if 'email' in data and data['email']:
             if not self._validate_email_format(data['email']):
@@ -217,24 +296,20 @@ class BaseScraper(ABC):
 
     def _validate_email_format(self, email: str) -> bool:
         """Validate email format with strict rules"""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, email):
+        if not _EMAIL_RE.match(email):
             return False
-            
+
         # Additional validation
         domain = email.split('@')[1]
-        invalid_domains = ['example.com', 'test.com', 'localhost']
-        if domain.lower() in invalid_domains:
+        if domain.lower() in _INVALID_DOMAINS:
             return False
-            
+
         return True
 
     def _validate_phone_format(self, phone: str) -> bool:
         """Validate phone number format"""
-        import re
         # Remove all non-numeric characters
-        digits = re.sub(r'\D', '', phone)
+        digits = phone.translate(_NON_DIGIT_TABLE)
         # Check if we have a reasonable number of digits
         return 10 <= len(digits) <= 15
 
@@ -242,9 +317,11 @@ class BaseScraper(ABC):
         """Clean and normalize all data fields"""
         cleaned = {}
         for key, value in data.items():
-            if isinstance(value, str):
+            if value is None:  # Skip empties before any type dispatch
+                continue
+            if isinstance(value, str):  # Most common case first
                 cleaned_val = clean_text(value)
-            elif isinstance(value, (list, tuple)):
+            elif isinstance(value, (list, tuple, set)):
                 cleaned_val = [clean_text(str(v)) for v in value if v]
             elif isinstance(value, dict):
                 cleaned_val = self.clean_data(value)
@@ -256,8 +333,8 @@ class BaseScraper(ABC):
 
     def retry_on_failure(self, func: callable, max_retries: int = None) -> Any:
         """Retry function with exponential backoff and cleanup"""
-        max_retries = max_retries or SCRAPING_CONFIG.get('retry_attempts', 3)
-        delay = SCRAPING_CONFIG.get('delay_between_requests', 2)
+        max_retries = max_retries or RETRY_ATTEMPTS
+        delay = DELAY_BETWEEN_REQUESTS
 
         for attempt in range(max_retries):
             try:
@@ -269,7 +346,7 @@ class BaseScraper(ABC):
                 # Cleanup between attempts
                 if self._driver:
                     self._driver.delete_all_cookies()
-                    self._execute_stealth_js()
+                    self._ensure_stealth()
                     
                 time.sleep(wait)
 
@@ -281,18 +358,28 @@ class BaseScraper(ABC):
         """Subclasses must implement this method"""
         pass
 
-    def __enter__(self):
-        return self
+    def close(self):
+        """Release the driver and HTTP session
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Cleanup resources"""
+        Safe to call more than once — an undisposed headless Chrome
+        keeps RAM and file descriptors until the host notices.
+        """
         if self._driver:
             try:
                 self._driver.quit()
             except Exception as e:
                 self.logger.error(f"Error closing driver: {e}")
-                
+            self._driver = None
+            self._wait = None
+
         try:
             self.session.close()
         except Exception as e:
-            self.logger.error(f"Error closing session: {e}")
\ No newline at end of file
+            self.logger.error(f"Error closing session: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Cleanup resources"""
+        self.close()
\ No newline at end of file
@@ -1,16 +1,65 @@
 from typing import Dict, Optional, List, Any
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from bs4 import BeautifulSoup
 import re
 import json
 import time
-from .base_scraper import BaseScraper
-from .utils import clean_text, extract_emails, validate_url
+import threading
+from .base_scraper import BaseScraper, DEFAULT_HTML_PARSER
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from .utils import clean_text, validate_email, validate_url
 from app.config import SCRAPING_PATTERNS, SCRAPING_CONFIG
 import logging
 
+# Compiled once at import so the per-page extraction loops reuse
+# ready-made Pattern objects instead of re-parsing raw strings.
+EMPLOYEE_COUNT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)\+?\s*employees',
+    r'team of (\d+)\+?',
+    r'(\d+)\+?\s*people',
+    r'company size:\s*(\d+)',
+))
+
+COMPANY_SIZE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(\d+)-(\d+)\s+employees',
+    r'(\d+)\+\s+employees',
+    r'company size:\s*([^<>\n]+)',
+))
+
+REVENUE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'revenue[:\s]+\$(\d+(?:\.\d+)?)[MBK]?-\$(\d+(?:\.\d+)?)[MBK]?',
+    r'annual revenue[:\s]+\$(\d+(?:\.\d+)?)[MBK]?',
+))
+
+# Fused scan: one alternation with named groups walks the page a single
+# time instead of re-traversing the full HTML per field (emails, phones,
+# each social platform, founded year).
+SOCIAL_PLATFORMS = ('linkedin', 'twitter', 'facebook', 'instagram')
+
+# Upper bound for plausible founding years, computed once at import
+# instead of per regex match
+_CURRENT_YEAR = time.gmtime().tm_year
+
+# Deletion table keeping digits and '+' — str.translate runs in C and
+# beats a regex sub on short phone strings
+_NON_DIGIT_PLUS_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(256) if not (chr(c).isdigit() or chr(c) == '+')
+))
+
+# Branches are derived from the shared SCRAPING_PATTERNS constants so
+# the regex source lives in exactly one place
+COMBINED_SCAN_PATTERN = re.compile('|'.join((
+    f"(?P<email>{SCRAPING_PATTERNS['email'].pattern})",
+    f"(?P<phone>{SCRAPING_PATTERNS['phone'].pattern})",
+    *(
+        f'(?P<{platform}>{pattern.pattern})'
+        for platform, pattern in SCRAPING_PATTERNS['social_media'].items()
+    ),
+    r'(?:founded in|established in|since)\s+(?P<founded_year>\d{4})',
+)), re.IGNORECASE)
+
 class CohesiveScraper(BaseScraper):
     def __init__(self):
         super().__init__()
@@ -21,49 +70,148 @@ class CohesiveScraper(BaseScraper):
         if not validate_url(url):
             self.logger.error(f"Invalid URL: {url}")
             return {}
-            
+
         try:
-            driver = self.get_driver()
-            self.logger.info(f"Starting to scrape: {url}")
-            
-            def scrape_attempt():
-                driver.get(url)
-                wait = WebDriverWait(driver, SCRAPING_CONFIG['timeout'])
-                
-                # Extract all available company information
-                company_data = {
-                    'name': self._extract_company_name(driver, wait),
-                    'website': url,
-                    'email': self._extract_email(driver),
-                    'phone': self._extract_phone(driver),
-                    'employees': self._extract_employee_count(driver),
-                    'location': self._extract_location(driver),
-                    'industry': self._extract_industry(driver),
-                    'social_links': self._extract_social_links(driver),
-                    'technologies': self._extract_technologies(driver),
-                    'meta_data': self._extract_meta_data(driver),
-                    'contact_info': self._extract_contact_info(driver),
-                    'description': self._extract_description(driver),
-                    'founded_year': self._extract_founded_year(driver),
-                    'company_size': self._extract_company_size(driver),
-                    'revenue_range': self._extract_revenue_range(driver),
-                    'headquarters': self._extract_headquarters(driver),
-                    'keywords': self._extract_keywords(driver)
-                }
-                
-                return self.clean_data(company_data)
-                
-            # Use retry mechanism for scraping
-            result = self.retry_on_failure(scrape_attempt)
-            
-            driver.quit()
-            return result or {}
-            
+            # Chrome runs with JavaScript disabled anyway, so a plain
+            # HTTP fetch sees the same HTML without browser overhead —
+            # only fall back to Selenium when the config demands JS
+            if SCRAPING_CONFIG.get('requires_js'):
+                return self._scrape_with_selenium(url)
+            return self._scrape_with_http(url)
+
         except Exception as e:
             self.logger.error(f"Error scraping {url}: {str(e)}")
             return {}
+
+    def _scrape_with_http(self, url: str) -> Dict[str, Any]:
+        """Fetch the page over the HTTP session and extract locally"""
+        self.logger.info(f"Starting to scrape (http): {url}")
+
+        def scrape_attempt():
+            page_source = self.fetch_html(url)
+            if page_source is None:
+                raise ValueError(f"Empty response from {url}")
+            return self._extract_all(None, page_source, url)
+
+        result = self.retry_on_failure(scrape_attempt)
+        return result or {}
+
+    def _scrape_with_selenium(self, url: str) -> Dict[str, Any]:
+        """Render the page in the headless browser before extracting"""
+        driver = self.get_driver()
+        self.logger.info(f"Starting to scrape (selenium): {url}")
+
+        def scrape_attempt():
+            driver.get(url)
+            self._wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
+
+            # Serialize the DOM once — each page_source access is a full
+            # Selenium roundtrip, so share one snapshot across helpers
+            return self._extract_all(driver, driver.page_source, url)
+
+        # Use retry mechanism for scraping; keep the driver alive so
+        # Chrome startup is amortized across a batch of URLs —
+        # BaseScraper.__exit__ owns the final quit()
+        result = self.retry_on_failure(scrape_attempt)
+        return result or {}
+
+    def _extract_all(self, driver, page_source: str, url: str) -> Dict[str, Any]:
+        """Run every extraction helper against one page snapshot"""
+        # Single fused regex pass over the page buckets the email,
+        # phone, social and founded-year matches for the helpers
+        buckets = self._scan_page(page_source)
+
+        # Parse once locally; every selector lookup below is then a
+        # pure in-memory query instead of a WebDriver call
+        soup = BeautifulSoup(page_source, DEFAULT_HTML_PARSER)
+
+        # Location is shared by three fields — resolve it once
+        location = self._extract_location(driver, soup)
+
+        # Extract all available company information
+        company_data = {
+            'name': self._extract_company_name(driver, soup),
+            'website': url,
+            'email': self._extract_email(driver, buckets),
+            'phone': self._extract_phone(driver, buckets),
+            'employees': self._extract_employee_count(driver, page_source),
+            'location': location,
+            'industry': self._extract_industry(driver, soup),
+            'social_links': self._extract_social_links(driver, buckets),
+            'technologies': self._extract_technologies(driver, soup),
+            'meta_data': self._extract_meta_data(driver, soup),
+            'contact_info': self._extract_contact_info(driver, buckets, soup, location),
+            'description': self._extract_description(driver, soup),
+            'founded_year': self._extract_founded_year(driver, buckets),
+            'company_size': self._extract_company_size(driver, page_source),
+            'revenue_range': self._extract_revenue_range(driver, page_source),
+            'headquarters': self._extract_headquarters(driver, soup, location),
+            'keywords': self._extract_keywords(driver, soup)
+        }
+
+        return self.clean_data(company_data)
+
+    def scrape_many(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """Scrape multiple URLs with a single reused driver"""
+        results = []
+        for url in urls:
+            self.handle_rate_limiting()
+            results.append(self.scrape_company_info(url))
+
+            # Light isolation between URLs without tearing Chrome down
+            if self._driver:
+                self._driver.delete_all_cookies()
+                self._ensure_stealth()
+
+        return results
+
+    def scrape_batch(self, urls: List[str], workers: int = 8) -> List[Dict[str, Any]]:
+        """Scrape URLs concurrently with one driver per worker thread
+
+        Selenium calls block on network rather than the GIL, so a small
+        thread pool hides per-URL latency. Each worker thread lazily
+        creates its own CohesiveScraper (and driver), so the worker
+        count is also the cap on live Chrome instances.
+        """
+        if not urls:
+            return []
+
+        workers = min(workers, len(urls))
+        thread_local = threading.local()
+        scrapers: List['CohesiveScraper'] = []
+        scrapers_lock = threading.Lock()
+
+        def scrape_one(url: str) -> Dict[str, Any]:
+            scraper = getattr(thread_local, 'scraper', None)
+            if scraper is None:
+                scraper = CohesiveScraper()
+                thread_local.scraper = scraper
+                with scrapers_lock:
+                    scrapers.append(scraper)
+            return scraper.scrape_company_info(url)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(scrape_one, urls))
+        finally:
+            for scraper in scrapers:
+                scraper.__exit__(None, None, None)
             
-    def _extract_company_name(self, driver, wait) -> Optional[str]:
+    def _get_soup(self, driver, soup=None) -> BeautifulSoup:
+        """Return the shared parsed page, building one if not provided"""
+        if soup is None:
+            soup = BeautifulSoup(driver.page_source, DEFAULT_HTML_PARSER)
+        return soup
+
+    @staticmethod
+    def _select_value(soup, selector: str, attr: str) -> Optional[str]:
+        """Query the parsed page for a selector's text or attribute value"""
+        element = soup.select_one(selector)
+        if element is None:
+            return None
+        return element.get(attr) if attr != 'text' else element.get_text()
+
+    def _extract_company_name(self, driver, soup=None) -> Optional[str]:
         """Extract company name using multiple methods"""
         selectors = [
             ('meta[property="og:site_name"]', 'content'),
@@ -74,58 +222,64 @@ class CohesiveScraper(BaseScraper):
             ('.company-name', 'text'),
             ('#company-name', 'text')
         ]
-        
+
+        soup = self._get_soup(driver, soup)
         for selector, attr in selectors:
-            try:
-                element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                value = element.get_attribute(attr) if attr != 'text' else element.text
-                if value:
-                    return clean_text(value)
-            except (TimeoutException, NoSuchElementException):
-                continue
+            value = self._select_value(soup, selector, attr)
+            if value:
+                return clean_text(value)
         return None
         
-    def _extract_email(self, driver) -> Optional[str]:
+    def _scan_page(self, page_source: str) -> Dict[str, List[str]]:
+        """Bucket matches from a single fused regex pass over the page"""
+        buckets: Dict[str, List[str]] = defaultdict(list)
+        for match in COMBINED_SCAN_PATTERN.finditer(page_source):
+            buckets[match.lastgroup].append(match.group(match.lastgroup))
+        return buckets
+
+    def _extract_email(self, driver, buckets=None) -> Optional[str]:
         """Extract email addresses from the page"""
-        page_source = driver.page_source
-        emails = extract_emails(page_source)
-        
-        # Filter out common invalid emails
-        valid_emails = [
-            email for email in emails
-            if not any(invalid in email.lower() for invalid in ['example', 'test', 'placeholder'])
-        ]
-        
-        return valid_emails[0] if valid_emails else None
-        
-    def _extract_phone(self, driver) -> Optional[str]:
+        if buckets is None:
+            # Standalone call: scan lazily so we stop at the first hit
+            candidates = (m.group() for m in SCRAPING_PATTERNS['email'].finditer(driver.page_source))
+        else:
+            candidates = buckets.get('email', [])
+
+        # Return the first match that survives the cheap substring
+        # filter and full validation — no need to materialize the rest
+        for email in candidates:
+            email = email.lower()
+            if any(invalid in email for invalid in ('example', 'test', 'placeholder')):
+                continue
+            if validate_email(email):
+                return email
+
+        return None
+
+    def _extract_phone(self, driver, buckets=None) -> Optional[str]:
         """Extract phone numbers using regex patterns"""
-        page_source = driver.page_source
-        phone_pattern = SCRAPING_PATTERNS['phone']
-        phones = re.findall(phone_pattern, page_source)
-        
-        # Clean and validate phone numbers
-        cleaned_phones = []
-        for phone in phones:
-            cleaned = re.sub(r'[^\d+]', '', phone)
+        if buckets is None:
+            # Standalone call: scan lazily so we stop at the first hit
+            candidates = (m.group() for m in SCRAPING_PATTERNS['phone'].finditer(driver.page_source))
+        else:
+            candidates = buckets.get('phone', [])
+
+        for phone in candidates:
+            cleaned = phone.translate(_NON_DIGIT_PLUS_TABLE)
             if len(cleaned) >= 10:
-                cleaned_phones.append(cleaned)
-                
-        return cleaned_phones[0] if cleaned_phones else None
+                return cleaned
+
+        return None
         
-    def _extract_employee_count(self, driver) -> Optional[int]:
+    def _extract_employee_count(self, driver, page_source=None) -> Optional[int]:
         """Extract employee count from various sources"""
-        patterns = [
-            r'(\d+)\+?\s*employees',
-            r'team of (\d+)\+?',
-            r'(\d+)\+?\s*people',
-            r'company size:\s*(\d+)',
-        ]
-        
-        page_source = driver.page_source.lower()
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, page_source)
+        if page_source is None:
+            page_source = driver.page_source
+
+        # Patterns are case-insensitive, so scan the original string
+        # instead of allocating a lowercased copy of the whole page
+        for pattern in EMPLOYEE_COUNT_PATTERNS:
+            matches = pattern.findall(page_source)
             if matches:
                 try:
                     return int(re.sub(r'[^\d]', '', matches[0]))
@@ -133,7 +287,7 @@ class CohesiveScraper(BaseScraper):
                     continue
         return None
         
-    def _extract_location(self, driver) -> Optional[str]:
+    def _extract_location(self, driver, soup=None) -> Optional[str]:
         """Extract company location"""
         location_selectors = [
             ('meta[property="business:contact_data:locality"]', 'content'),
@@ -142,19 +296,16 @@ class CohesiveScraper(BaseScraper):
             ('.location', 'text'),
             ('[itemtype="http://schema.org/PostalAddress"]', 'text')
         ]
-        
+
+        soup = self._get_soup(driver, soup)
         for selector, attr in location_selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                value = element.get_attribute(attr) if attr != 'text' else element.text
-                if value:
-                    return clean_text(value)
-            except NoSuchElementException:
-                continue
-                
+            value = self._select_value(soup, selector, attr)
+            if value:
+                return clean_text(value)
+
         return None
         
-    def _extract_industry(self, driver) -> Optional[str]:
+    def _extract_industry(self, driver, soup=None) -> Optional[str]:
         """Extract company industry"""
         industry_selectors = [
             ('meta[property="business:industry"]', 'content'),
@@ -162,75 +313,76 @@ class CohesiveScraper(BaseScraper):
             ('#industry', 'text'),
             ('[itemprop="industry"]', 'text')
         ]
-        
+
+        soup = self._get_soup(driver, soup)
         for selector, attr in industry_selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                value = element.get_attribute(attr) if attr != 'text' else element.text
-                if value:
-                    return clean_text(value)
-            except NoSuchElementException:
-                continue
-                
+            value = self._select_value(soup, selector, attr)
+            if value:
+                return clean_text(value)
+
         return None
         
-    def _extract_social_links(self, driver) -> Dict[str, str]:
+    def _extract_social_links(self, driver, buckets=None) -> Dict[str, str]:
         """Extract social media links"""
         social_links = {}
-        page_source = driver.page_source
-        
-        for platform, pattern in SCRAPING_PATTERNS['social_media'].items():
-            matches = re.findall(pattern, page_source)
+        if buckets is None:
+            buckets = self._scan_page(driver.page_source)
+
+        for platform in SOCIAL_PLATFORMS:
+            matches = buckets.get(platform)
             if matches:
                 social_links[platform] = f"https://{matches[0]}"
-                
+
         return social_links
         
-    def _extract_technologies(self, driver) -> List[str]:
+    def _extract_technologies(self, driver, soup=None) -> List[str]:
         """Extract technologies used by the company"""
         technologies = set()
-        
+        soup = self._get_soup(driver, soup)
+
         # Check meta tags
-        meta_tags = driver.find_elements(By.TAG_NAME, 'meta')
-        for tag in meta_tags:
-            content = tag.get_attribute('content')
+        for tag in soup.find_all('meta'):
+            content = tag.get('content')
             if content:
                 tech_matches = re.findall(r'(React|Angular|Vue|Python|Java|AWS|Azure|Docker)', content)
                 technologies.update(tech_matches)
-        
+
         # Check script tags
-        script_tags = driver.find_elements(By.TAG_NAME, 'script')
-        for script in script_tags:
-            src = script.get_attribute('src')
+        for script in soup.find_all('script'):
+            src = script.get('src')
             if src:
                 tech_matches = re.findall(r'(react|angular|vue|jquery|bootstrap)', src.lower())
                 technologies.update([t.capitalize() for t in tech_matches])
-        
+
         return list(technologies)
         
-    def _extract_meta_data(self, driver) -> Dict[str, str]:
+    def _extract_meta_data(self, driver, soup=None) -> Dict[str, str]:
         """Extract metadata from page"""
         meta_data = {}
-        meta_tags = driver.find_elements(By.TAG_NAME, 'meta')
-        
-        for tag in meta_tags:
-            name = tag.get_attribute('name') or tag.get_attribute('property')
-            content = tag.get_attribute('content')
+        soup = self._get_soup(driver, soup)
+
+        for tag in soup.find_all('meta'):
+            name = tag.get('name') or tag.get('property')
+            content = tag.get('content')
             if name and content:
                 meta_data[name] = content
-                
+
         return meta_data
         
-    def _extract_contact_info(self, driver) -> Dict[str, Any]:
+    def _extract_contact_info(self, driver, buckets=None, soup=None, location=None) -> Dict[str, Any]:
         """Extract all contact information"""
+        if buckets is None:
+            buckets = self._scan_page(driver.page_source)
+        if location is None:
+            location = self._extract_location(driver, soup)
         contact_info = {
-            'emails': extract_emails(driver.page_source),
-            'phones': re.findall(SCRAPING_PATTERNS['phone'], driver.page_source),
-            'address': self._extract_location(driver)
+            'emails': {email.lower() for email in buckets.get('email', []) if validate_email(email)},
+            'phones': buckets.get('phone', []),
+            'address': location
         }
         return {k: v for k, v in contact_info.items() if v}
         
-    def _extract_description(self, driver) -> Optional[str]:
+    def _extract_description(self, driver, soup=None) -> Optional[str]:
         """Extract company description"""
         description_selectors = [
             ('meta[name="description"]', 'content'),
@@ -238,110 +390,88 @@ class CohesiveScraper(BaseScraper):
             ('.company-description', 'text'),
             ('.about-us', 'text')
         ]
-        
+
+        soup = self._get_soup(driver, soup)
         for selector, attr in description_selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                value = element.get_attribute(attr) if attr != 'text' else element.text
-                if value:
-                    return clean_text(value)
-            except NoSuchElementException:
-                continue
-                
+            value = self._select_value(soup, selector, attr)
+            if value:
+                return clean_text(value)
+
         return None
         
-    def _extract_founded_year(self, driver) -> Optional[int]:
+    def _extract_founded_year(self, driver, buckets=None) -> Optional[int]:
         """Extract company founding year"""
-        patterns = [
-            r'[Ff]ounded in (\d{4})',
-            r'[Ee]stablished in (\d{4})',
-            r'[Ss]ince (\d{4})'
-        ]
-        
-        page_source = driver.page_source
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, page_source)
-            if matches:
-                try:
-                    year = int(matches[0])
-                    if 1800 <= year <= time.gmtime().tm_year:
-                        return year
-                except ValueError:
-                    continue
-                    
+        if buckets is None:
+            buckets = self._scan_page(driver.page_source)
+
+        for match in buckets.get('founded_year', []):
+            try:
+                year = int(match)
+                if 1800 <= year <= _CURRENT_YEAR:
+                    return year
+            except ValueError:
+                continue
+
         return None
         
-    def _extract_company_size(self, driver) -> Optional[str]:
+    def _extract_company_size(self, driver, page_source=None) -> Optional[str]:
         """Extract company size range"""
-        size_patterns = [
-            r'(\d+)-(\d+)\s+employees',
-            r'(\d+)\+\s+employees',
-            r'company size:\s*([^<>\n]+)'
-        ]
-        
-        page_source = driver.page_source.lower()
-        
-        for pattern in size_patterns:
-            matches = re.findall(pattern, page_source)
+        if page_source is None:
+            page_source = driver.page_source
+
+        # Patterns are case-insensitive, so scan the original string
+        # instead of allocating a lowercased copy of the whole page
+        for pattern in COMPANY_SIZE_PATTERNS:
+            matches = pattern.findall(page_source)
             if matches:
                 return matches[0] if isinstance(matches[0], str) else f"{matches[0][0]}-{matches[0][1]}"
                 
         return None
         
-    def _extract_revenue_range(self, driver) -> Optional[str]:
+    def _extract_revenue_range(self, driver, page_source=None) -> Optional[str]:
         """Extract company revenue range"""
-        revenue_patterns = [
-            r'revenue[:\s]+\$(\d+(?:\.\d+)?)[MBK]?-\$(\d+(?:\.\d+)?)[MBK]?',
-            r'annual revenue[:\s]+\$(\d+(?:\.\d+)?)[MBK]?'
-        ]
-        
-        page_source = driver.page_source
-        
-        for pattern in revenue_patterns:
-            matches = re.findall(pattern, page_source, re.IGNORECASE)
+        if page_source is None:
+            page_source = driver.page_source
+
+        for pattern in REVENUE_PATTERNS:
+            matches = pattern.findall(page_source)
             if matches:
                 return matches[0] if isinstance(matches[0], str) else f"${matches[0][0]}-${matches[0][1]}"
                 
         return None
         
-    def _extract_headquarters(self, driver) -> Optional[str]:
+    def _extract_headquarters(self, driver, soup=None, location=None) -> Optional[str]:
         """Extract company headquarters location"""
+        # Only HQ-specific selectors are queried here; the shared
+        # address/meta selectors are covered by _extract_location
         hq_selectors = [
-            ('[itemtype="http://schema.org/PostalAddress"]', 'text'),
             ('.headquarters', 'text'),
-            ('.hq-location', 'text'),
-            ('meta[property="business:contact_data:locality"]', 'content')
+            ('.hq-location', 'text')
         ]
-        
+
+        soup = self._get_soup(driver, soup)
         for selector, attr in hq_selectors:
-            try:
-                element = driver.find_element(By.CSS_SELECTOR, selector)
-                value = element.get_attribute(attr) if attr != 'text' else element.text
-                if value:
-                    return clean_text(value)
-            except NoSuchElementException:
-                continue
-                
-        return None
+            value = self._select_value(soup, selector, attr)
+            if value:
+                return clean_text(value)
+
+        if location is None:
+            location = self._extract_location(driver, soup)
+        return location
         
-    def _extract_keywords(self, driver) -> List[str]:
+    def _extract_keywords(self, driver, soup=None) -> List[str]:
         """Extract relevant keywords from the page"""
         keywords = set()
-        
+        soup = self._get_soup(driver, soup)
+
         # Check meta keywords
-        try:
-            meta_keywords = driver.find_element(By.CSS_SELECTOR, 'meta[name="keywords"]')
-            if meta_keywords:
-                keywords.update(meta_keywords.get_attribute('content').split(','))
-        except NoSuchElementException:
-            pass
-            
+        meta_keywords = soup.select_one('meta[name="keywords"]')
+        if meta_keywords and meta_keywords.get('content'):
+            keywords.update(meta_keywords['content'].split(','))
+
         # Extract from headings
-        for tag in ['h1', 'h2', 'h3']:
-            elements = driver.find_elements(By.TAG_NAME, tag)
-            for element in elements:
-                words = element.text.split()
-                keywords.update(words)
-                
+        for element in soup.find_all(['h1', 'h2', 'h3']):
+            words = element.get_text().split()
+            keywords.update(words)
+
         return [clean_text(k) for k in keywords if len(clean_text(k)) > 2]
\ No newline at end of file
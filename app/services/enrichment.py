@@ -1,8 +1,14 @@
 import re
 import os
+import numpy as np
+import pandas as pd
 import requests
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
-from typing import Dict, Any
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -10,6 +16,24 @@ load_dotenv()
 
 PROXYCURL_API_KEY = os.getenv("PROXYCURL_API_KEY")
 
+# Compiled once — is_valid_email runs per lead
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+
+# One keep-alive session per process: reusing the pooled connection to
+# the Proxycurl host avoids a fresh TCP+TLS handshake per lead
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+))
+if PROXYCURL_API_KEY:
+    _SESSION.headers.update({"Authorization": f"Bearer {PROXYCURL_API_KEY}"})
+
 # ─────────────────────────────────────────────
 # Validation & Utility Functions
 # ─────────────────────────────────────────────
@@ -18,8 +42,7 @@ def is_valid_email(email: str) -> bool:
     """Validate email using regex."""
     if not email:
         return False
-    regex = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-    return re.match(regex, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def extract_domain_from_url(url: str) -> str:
@@ -57,6 +80,32 @@ def score_lead(lead: Dict[str, Any]) -> int:
     return score
 
 
+def score_leads_batch(df: pd.DataFrame) -> np.ndarray:
+    """Score a whole frame of leads in one vectorized pass.
+
+    Equivalent to mapping score_lead row by row, but the boolean
+    columns and the weighted sum are computed as numpy array ops, so
+    large batches skip the per-row dict lookups entirely.
+    """
+    n = len(df)
+    if n == 0:
+        return np.zeros(0, dtype=np.int32)
+
+    def _col(name: str) -> pd.Series:
+        if name in df.columns:
+            return df[name].fillna('')
+        return pd.Series('', index=df.index)
+
+    email_ok = _col('email').map(is_valid_email).to_numpy()
+    score = (
+        email_ok * 30
+        + _col('company').astype(bool).to_numpy() * 20
+        + _col('linkedin').astype(bool).to_numpy() * 25
+        + _col('website').astype(bool).to_numpy() * 25
+    )
+    return score.astype(np.int32)
+
+
 # ─────────────────────────────────────────────
 # Enrichment via Proxycurl
 # ─────────────────────────────────────────────
@@ -71,29 +120,44 @@ def enrich_with_proxycurl(website: str) -> Dict[str, Any]:
         return {}
 
     domain = extract_domain_from_url(website)
-    headers = {
-        "Authorization": f"Bearer {PROXYCURL_API_KEY}"
-    }
-    api_url = "https://nubela.co/proxycurl/api/linkedin/company"
-    params = {
-        "url": f"https://{domain}",
-        "use_cache": "if-present"
-    }
+    if not domain:
+        return {}
 
     try:
-        response = requests.get(api_url, headers=headers, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
+        # Copy so callers mutating the enriched lead can't corrupt the
+        # cached entry shared by every other lead on the same domain
+        return dict(_fetch_company_by_domain(domain))
     except requests.exceptions.HTTPError as e:
-        print(f"❌ Proxycurl HTTP error: {e} | Status: {response.status_code}")
+        print(f"❌ Proxycurl HTTP error: {e}")
     except requests.exceptions.RequestException as e:
         print(f"❌ Proxycurl connection error: {e}")
     except Exception as e:
         print(f"❌ Proxycurl unknown error: {e}")
-    
+
     return {}
 
 
+@lru_cache(maxsize=1024)
+def _fetch_company_by_domain(domain: str) -> Dict[str, Any]:
+    """Fetch Proxycurl company data for a domain.
+
+    Memoized per process — many leads share the same company, so
+    duplicate API calls are skipped outright. Failures raise out of the
+    cache: lru_cache does not store the entry when the call throws, so
+    a timeout or 5xx is retried on the next lead instead of pinning the
+    domain to an empty result for the life of the process.
+    """
+    api_url = "https://nubela.co/proxycurl/api/linkedin/company"
+    params = {
+        "url": f"https://{domain}",
+        "use_cache": "if-present"
+    }
+
+    response = _SESSION.get(api_url, params=params, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
 # ─────────────────────────────────────────────
 # Master Lead Enrichment Function
 # ─────────────────────────────────────────────
@@ -119,3 +183,18 @@ def enrich_lead(lead: Dict[str, Any]) -> Dict[str, Any]:
     # Scoring
     enriched['lead_score'] = score_lead(enriched)
     return enriched
+
+
+def enrich_leads_batch(leads: List[Dict[str, Any]], concurrency: int = 16) -> List[Dict[str, Any]]:
+    """
+    Enrich a batch of leads concurrently.
+
+    Each lead is independent and blocks on the Proxycurl round trip,
+    so a small thread pool overlaps the per-lead HTTP latency; the
+    shared session's connection pool is reused across workers.
+    """
+    if not leads:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(leads))) as executor:
+        return list(executor.map(enrich_lead, leads))
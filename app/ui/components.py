@@ -1,11 +1,73 @@
 import streamlit as st
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import json
 import pandas as pd
 from datetime import datetime
 import plotly.express as px
 import plotly.graph_objects as go
-from ..scraper.utils import save_to_file
-import validators
+from ..scraper.utils import save_to_file, validate_url
+
+
+# Streamlit reruns the whole script on every widget interaction, so the
+# DataFrame build, summary reductions and plotly figures below are cached
+# on a JSON snapshot of the scraped data — unchanged results cost a dict
+# lookup instead of a full recompute per rerun.
+
+@st.cache_data(show_spinner=False)
+def _build_dataframe(data_key: str) -> pd.DataFrame:
+    return pd.DataFrame(json.loads(data_key))
+
+
+@st.cache_data(show_spinner=False)
+def _summary_stats(data_key: str) -> Tuple[int, int, int, float]:
+    df = _build_dataframe(data_key)
+
+    # One agg call so pandas plans a single traversal of the involved
+    # columns; count() already ignores NaN like notna().sum() did
+    aggs = {}
+    if 'email' in df.columns:
+        aggs['email'] = 'count'
+    if 'industry' in df.columns:
+        aggs['industry'] = 'nunique'
+    if 'employees' in df.columns:
+        aggs['employees'] = 'mean'
+    stats = df.agg(aggs) if aggs else pd.Series(dtype=float)
+
+    avg_employees = stats.get('employees', 0)
+    if pd.isna(avg_employees):
+        avg_employees = 0
+    return (
+        len(df),
+        int(stats.get('email', 0)),
+        int(stats.get('industry', 0)),
+        float(avg_employees),
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _industry_fig(data_key: str) -> Optional[go.Figure]:
+    df = _build_dataframe(data_key)
+    if 'industry' not in df.columns or df['industry'].isna().all():
+        return None
+    industry_counts = df['industry'].value_counts()
+    return px.pie(
+        values=industry_counts.values,
+        names=industry_counts.index,
+        title="Industry Distribution"
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _size_fig(data_key: str) -> Optional[go.Figure]:
+    df = _build_dataframe(data_key)
+    if 'employees' not in df.columns or df['employees'].isna().all():
+        return None
+    return px.histogram(
+        df,
+        x='employees',
+        title="Company Size Distribution",
+        nbins=20
+    )
 
 def render_header():
     """Render application header with styling"""
@@ -129,8 +191,9 @@ def render_url_input() -> str:
         if st.button("Validate URLs"):
             if urls.strip():
                 url_list = [url.strip() for url in urls.split('\n') if url.strip()]
-                valid_count = sum(1 for url in url_list if validators.url(url))
-                invalid_urls = [url for url in url_list if not validators.url(url)]
+                # Single cached validation pass instead of two loops
+                invalid_urls = [url for url in url_list if not validate_url(url)]
+                valid_count = len(url_list) - len(invalid_urls)
 
                 st.success(f"✅ Valid URLs: {valid_count}/{len(url_list)}")
 
@@ -160,67 +223,58 @@ def render_results(data: List[Dict[str, Any]]):
         st.warning("No data available to display.")
         return
         
-    df = pd.DataFrame(data)
-    
+    # Hashable cache key shared by every cached helper below
+    data_key = json.dumps(data, sort_keys=True, default=str)
+    df = _build_dataframe(data_key)
+
     # Summary metrics
     st.subheader("Summary Metrics")
     col1, col2, col3, col4 = st.columns(4)
-    
+
+    total, email_count, industry_count, avg_employees = _summary_stats(data_key)
+
     with col1:
         st.metric(
             "Total Companies",
-            len(df),
+            total,
             help="Total number of companies scraped"
         )
     with col2:
-        email_count = df['email'].notna().sum() if 'email' in df.columns else 0
         st.metric(
             "Valid Emails Found",
             email_count,
             help="Number of companies with valid email contacts"
         )
     with col3:
-        industry_count = df['industry'].nunique() if 'industry' in df.columns else 0
         st.metric(
             "Industries Found",
             industry_count,
             help="Number of unique industries"
         )
     with col4:
-        avg_employees = df['employees'].mean() if 'employees' in df.columns else 0
         st.metric(
             "Avg. Company Size",
             f"{avg_employees:.0f}",
             help="Average number of employees"
         )
-    
+
     # Data visualizations
     st.subheader("Data Analysis")
-    
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
         # Industry distribution
-        if 'industry' in df.columns and not df['industry'].isna().all():
-            industry_counts = df['industry'].value_counts()
-            fig = px.pie(
-                values=industry_counts.values,
-                names=industry_counts.index,
-                title="Industry Distribution"
-            )
+        fig = _industry_fig(data_key)
+        if fig is not None:
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No industry data available for visualization")
-            
+
     with col2:
         # Company size distribution
-        if 'employees' in df.columns and not df['employees'].isna().all():
-            fig = px.histogram(
-                df,
-                x='employees',
-                title="Company Size Distribution",
-                nbins=20
-            )
+        fig = _size_fig(data_key)
+        if fig is not None:
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No employee data available for visualization")
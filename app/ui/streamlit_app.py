@@ -1,11 +1,15 @@
 import streamlit as st
-import sys
-import os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
-from typing import List, Dict, Any
-import validators
+import atexit
+from typing import List, Dict, Any, Optional
+import re
 import time
+import threading
+import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
 from app.scraper.cohesive_clone import CohesiveScraper
+from app.scraper.utils import validate_url
 from app.ui.components import (
     render_header,
     render_filters,
@@ -17,13 +21,147 @@ from app.ui.components import (
 )
 from app.config import SCRAPING_CONFIG
 
+# Per-host request spacing so concurrent workers still honor the
+# configured delay against any single site while overlapping waits on
+# different hosts
+_HOST_GATES: Dict[str, threading.Lock] = {}
+_HOST_LAST_REQUEST: Dict[str, float] = {}
+_HOST_GATES_LOCK = threading.Lock()
+
+
+def _rate_limited_scrape(scraper: CohesiveScraper, url: str) -> Dict[str, Any]:
+    """Scrape one URL, spacing requests to the same host"""
+    host = urlsplit(url).netloc
+    with _HOST_GATES_LOCK:
+        gate = _HOST_GATES.setdefault(host, threading.Lock())
+
+    with gate:
+        last = _HOST_LAST_REQUEST.get(host, 0.0)
+        wait = last + SCRAPING_CONFIG['delay_between_requests'] - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _HOST_LAST_REQUEST[host] = time.monotonic()
+
+    return scraper.scrape_company_info(url)
+
+
+class _ScraperPool:
+    """Check-out/check-in pool of CohesiveScraper instances
+
+    CohesiveScraper owns a single Selenium session and requests.Session
+    and is not safe to share across threads, so each scrape checks a
+    scraper out of the idle queue (building one only when the queue is
+    empty) and returns it afterwards. Keying on the pool rather than on
+    thread identity means the instances — and the persistent drivers
+    they lazily create — survive the short-lived executor threads that
+    each Start Scraping press spins up, and the pool never grows past
+    the peak number of concurrent scrapes.
+    """
+
+    def __init__(self):
+        self._idle: List[CohesiveScraper] = []
+        self._all: List[CohesiveScraper] = []
+        self._lock = threading.Lock()
+
+    def _acquire(self) -> CohesiveScraper:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        scraper = CohesiveScraper()
+        with self._lock:
+            self._all.append(scraper)
+        return scraper
+
+    def _release(self, scraper: CohesiveScraper):
+        with self._lock:
+            self._idle.append(scraper)
+
+    def scrape(self, url: str) -> Dict[str, Any]:
+        """Scrape one URL with a checked-out scraper"""
+        scraper = self._acquire()
+        try:
+            return _rate_limited_scrape(scraper, url)
+        finally:
+            self._release(scraper)
+
+    def close(self):
+        """Release every scraper created by the pool"""
+        with self._lock:
+            scrapers, self._all, self._idle = self._all, [], []
+        for scraper in scrapers:
+            scraper.close()
+
+
+@st.cache_resource(show_spinner=False)
+def get_scraper_pool() -> _ScraperPool:
+    """Build the scraper pool once per process
+
+    ChromeDriver startup costs seconds; the cached resource keeps each
+    worker's scraper — and the persistent driver it lazily creates —
+    alive across batches and Streamlit reruns. atexit guarantees the
+    browsers die with the process instead of lingering as zombies.
+    """
+    pool = _ScraperPool()
+    atexit.register(pool.close)
+    return pool
+
+
+# Per-URL result memo with TTL, probed and populated from the script
+# thread only — worker threads must not touch Streamlit's caching
+# machinery, which is unsupported outside a ScriptRunContext
+_SCRAPE_CACHE: Dict[str, Any] = {}
+_SCRAPE_CACHE_LOCK = threading.Lock()
+_SCRAPE_CACHE_TTL = SCRAPING_CONFIG.get('cache_ttl', 3600)
+
+
+def _cached_result(url: str) -> Optional[Dict[str, Any]]:
+    """Return the cached record for a URL if still fresh"""
+    with _SCRAPE_CACHE_LOCK:
+        entry = _SCRAPE_CACHE.get(url)
+    if entry and time.monotonic() - entry[0] < _SCRAPE_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def _store_result(url: str, result: Dict[str, Any]):
+    """Remember a scraped record for later reruns
+
+    Expired entries are evicted on the way in so a long-lived server
+    doesn't accumulate every URL it has ever scraped.
+    """
+    now = time.monotonic()
+    with _SCRAPE_CACHE_LOCK:
+        expired = [
+            key for key, (stored_at, _) in _SCRAPE_CACHE.items()
+            if now - stored_at >= _SCRAPE_CACHE_TTL
+        ]
+        for key in expired:
+            del _SCRAPE_CACHE[key]
+        _SCRAPE_CACHE[url] = (now, result)
+
+
+# Revenue slider labels mapped to thresholds; "0" maps to no filtering
+_REVENUE_MAP = {
+    "1M": 1000000,
+    "5M": 5000000,
+    "10M": 10000000,
+    "50M": 50000000,
+    "100M": 100000000,
+    "500M": 500000000,
+    "1B+": 1000000000
+}
+
 def validate_urls(urls: str) -> List[str]:
     """Validate and clean URLs"""
     if not urls:
         return []
         
     url_list = [url.strip() for url in urls.split('\n') if url.strip()]
-    valid_urls = [url for url in url_list if validators.url(url)]
+    # Anchored-regex fast path, cached per URL — validators.url rebuilt
+    # its whole validation pipeline on every call. dict.fromkeys drops
+    # pasted duplicates while preserving input order, so no URL is
+    # scraped twice.
+    valid_urls = list(dict.fromkeys(url for url in url_list if validate_url(url)))
     
     if not valid_urls:
         render_error("Please enter valid URLs")
@@ -35,102 +173,118 @@ def validate_urls(urls: str) -> List[str]:
         
     return valid_urls
 
-def validate_scraped_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Validate and clean scraped data"""
-    if not data:
-        return []
-    
-    valid_data = []
-    required_fields = ['name', 'website']
-    
-    for item in data:
-        if not isinstance(item, dict):
-            continue
-            
-        # Ensure all required fields exist
-        if not all(field in item for field in required_fields):
-            continue
-            
-        # Ensure no None values in required fields
-        if any(item[field] is None for field in required_fields):
-            continue
-            
-        valid_data.append(item)
-        
-    return valid_data
+# Fields every scraped record must carry to be worth keeping
+_REQUIRED_FIELDS = ('name', 'website')
+
+
+def _valid_and_filtered(
+    results: List[Dict[str, Any]], filters: Dict
+) -> tuple:
+    """Validate and filter scraped results in one walk over the list
+
+    The required-field membership and None checks collapse into a
+    single comprehension (a missing key and an explicit None are the
+    same via .get), so the validated list feeds the vectorized filter
+    directly with no intermediate validation pass.
+    """
+    valid = [
+        item for item in results
+        if isinstance(item, dict)
+        and all(item.get(field) is not None for field in _REQUIRED_FIELDS)
+    ]
+    return valid, apply_filters(valid, filters)
 
 def apply_filters(data: List[Dict[str, Any]], filters: Dict) -> List[Dict[str, Any]]:
-    """Apply filters to scraped data"""
+    """Apply filters to scraped data
+
+    Builds one boolean mask per active filter as a vectorized pandas
+    operation and ANDs them together, so the batch is scanned in C
+    instead of one Python list comprehension per filter.
+    """
     if not data:
         return []
-        
-    filtered_data = data.copy()
-    
+
+    # Common first-render state: no filter set, nothing to compute
+    if not (
+        filters['min_employees']
+        or filters['industry']
+        or filters['location']
+        or filters['technologies']
+        or filters['has_email']
+        or filters['has_social']
+        or _REVENUE_MAP.get(filters['min_revenue'], 0)
+    ):
+        return data
+
+    df = pd.DataFrame(data)
+    mask = pd.Series(True, index=df.index)
+
+    def column(name: str, default: Any) -> pd.Series:
+        if name in df.columns:
+            return df[name]
+        return pd.Series(default, index=df.index)
+
     # Apply basic filters
     if filters['min_employees'] > 0:
-        filtered_data = [
-            d for d in filtered_data
-            if d.get('employees', 0) >= filters['min_employees']
-        ]
-        
+        employees = pd.to_numeric(column('employees', 0), errors='coerce').fillna(0)
+        mask &= employees >= filters['min_employees']
+
     if filters['industry']:
-        filtered_data = [
-            d for d in filtered_data
-            if d.get('industry') in filters['industry']
-        ]
-        
+        mask &= column('industry', None).isin(filters['industry'])
+
     if filters['location']:
         locations = [loc.strip().lower() for loc in filters['location'].split(',')]
-        filtered_data = [
-            d for d in filtered_data
-            if any(loc in str(d.get('location', '')).lower() for loc in locations)
-        ]
-        
+        pattern = '|'.join(re.escape(loc) for loc in locations if loc)
+        if pattern:
+            # fillna first — astype(str) would turn missing cells into
+            # the literal 'nan', which substring-matches short tokens
+            mask &= (
+                column('location', '')
+                .fillna('')
+                .astype(str)
+                .str.lower()
+                .str.contains(pattern)
+            )
+
     if filters['technologies']:
-        filtered_data = [
-            d for d in filtered_data
-            if any(tech in d.get('technologies', []) for tech in filters['technologies'])
-        ]
-    
+        # Explode the per-row lists once, then one isin pass
+        hits = (
+            column('technologies', None)
+            .explode()
+            .isin(filters['technologies'])
+            .groupby(level=0)
+            .any()
+        )
+        mask &= hits.reindex(df.index, fill_value=False)
+
     # Apply advanced filters
     if filters['has_email']:
-        filtered_data = [d for d in filtered_data if d.get('email')]
-        
+        mask &= column('email', '').fillna('').astype(bool)
+
     if filters['has_social']:
-        filtered_data = [
-            d for d in filtered_data
-            if d.get('social_links') and len(d['social_links']) > 0
-        ]
-        
-    if filters['min_revenue'] != "0":
-        revenue_map = {
-            "1M": 1000000,
-            "5M": 5000000,
-            "10M": 10000000,
-            "50M": 50000000,
-            "100M": 100000000,
-            "500M": 500000000,
-            "1B+": 1000000000
-        }
-        min_revenue = revenue_map[filters['min_revenue']]
-        filtered_data = [
-            d for d in filtered_data
-            if d.get('revenue', 0) >= min_revenue
-        ]
-        
-    return filtered_data
+        mask &= column('social_links', None).str.len().fillna(0) > 0
+
+    min_revenue = _REVENUE_MAP.get(filters['min_revenue'], 0)
+    if min_revenue:
+        revenue = pd.to_numeric(column('revenue', 0), errors='coerce').fillna(0)
+        mask &= revenue >= min_revenue
+
+    return df.loc[mask].to_dict('records')
 
 def main():
     """Main application entry point"""
     try:
         render_header()
         
-        # Initialize session state
+        # Initialize session state; the bounded deque keeps appends O(1)
+        # and caps memory over a long incremental-scraping session
         if 'scraping_results' not in st.session_state:
-            st.session_state.scraping_results = []
+            st.session_state.scraping_results = deque(
+                maxlen=SCRAPING_CONFIG.get('max_results_cached', 10000)
+            )
             
-        # Initialize scraper
-        scraper = CohesiveScraper()
+        # Initialize scraper pool (shared across reruns)
+        scraper_pool = get_scraper_pool()
         
         # Render filters
         filters = render_filters()
@@ -149,38 +303,62 @@ def main():
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     
-                    # Scrape data
+                    # Resolve fresh cache hits here on the script thread,
+                    # then scrape only the misses — the work is network-
+                    # bound, so a small thread pool overlaps per-URL
+                    # latency and the per-host gate replaces the blanket
+                    # sleep between requests
                     results = []
-                    for idx, url in enumerate(valid_urls):
-                        status_text.text(f"Scraping {url}...")
-                        
-                        try:
-                            result = scraper.scrape_company_info(url)
-                            if result:
-                                results.append(result)
-                        except Exception as e:
-                            render_error(f"Error scraping {url}: {str(e)}")
-                            continue
-                            
-                        # Update progress
-                        progress = (idx + 1) / len(valid_urls)
-                        progress_bar.progress(progress)
-                        
-                        # Add delay to prevent rate limiting
-                        time.sleep(SCRAPING_CONFIG['delay_between_requests'])
-                    
-                    # Validate and clean results
-                    valid_results = validate_scraped_data(results)
+                    pending = []
+                    for url in valid_urls:
+                        cached = _cached_result(url)
+                        if cached is not None:
+                            results.append(cached)
+                        else:
+                            pending.append(url)
+
+                    completed = len(results)
+                    total = len(valid_urls)
+                    max_workers = SCRAPING_CONFIG.get('max_workers', 4)
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        futures = {
+                            executor.submit(scraper_pool.scrape, url): url
+                            for url in pending
+                        }
+
+                        last_update = 0.0
+                        for future in as_completed(futures):
+                            url = futures[future]
+                            try:
+                                result = future.result()
+                                if result:
+                                    _store_result(url, result)
+                                    results.append(result)
+                            except Exception as e:
+                                render_error(f"Error scraping {url}: {str(e)}")
+
+                            completed += 1
+                            # Each update is a websocket message to the
+                            # browser; ~10 Hz is plenty for a human
+                            now = time.monotonic()
+                            if now - last_update > 0.1 or completed == total:
+                                status_text.text(f"Scraped {url}")
+                                progress_bar.progress(completed / total)
+                                last_update = now
+
+                    if not pending:
+                        status_text.text("All URLs served from cache")
+                        progress_bar.progress(1.0)
                     
+                    # Validate and filter in one fused pass
+                    valid_results, filtered_results = _valid_and_filtered(results, filters)
+
                     if not valid_results:
                         render_error("No valid data was scraped")
                         return
-                    
+
                     # Store results in session state
-                    st.session_state.scraping_results = valid_results
-                    
-                    # Apply filters and display results
-                    filtered_results = apply_filters(valid_results, filters)
+                    st.session_state.scraping_results.extend(valid_results)
                     
                     if filtered_results:
                         render_success(f"Successfully scraped {len(filtered_results)} companies")
@@ -1,5 +1,3 @@
-import os
-import sys
 from pathlib import Path
 from dotenv import load_dotenv
 from selenium import webdriver
@@ -7,9 +5,6 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import WebDriverException
 
-# ⛓️ Tambahkan root folder ke PYTHONPATH supaya bisa import app.config
-sys.path.append(str(Path(__file__).resolve().parent.parent))
-
 # 📦 Load .env dari root project folder
 env_path = Path(__file__).resolve().parents[1] / ".env"
 if not env_path.exists():
@@ -34,6 +29,12 @@ options.add_argument("--no-sandbox")
 options.add_argument("--disable-dev-shm-usage")
 options.add_argument("--disable-gpu")
 options.add_argument("--window-size=1920,1080")
+# DOM-ready is enough for HTML scraping — don't wait for tracker tails
+options.page_load_strategy = "eager"
+options.add_argument("--blink-settings=imagesEnabled=false")
+options.add_experimental_option(
+    "prefs", {"profile.managed_default_content_settings.images": 2}
+)
 
 # 🚀 Jalankan ChromeDriver
 driver = None